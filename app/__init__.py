@@ -1,9 +1,11 @@
 from flask import Flask
+from werkzeug.middleware.proxy_fix import ProxyFix
 import os
 from dotenv import load_dotenv
 from prometheus_flask_exporter import PrometheusMetrics
 from prometheus_client import Counter, Gauge, Histogram, Summary
 from flasgger import Swagger
+from app.cardinality import guard_labels
 
 
 # Main application metrics
@@ -14,10 +16,14 @@ version_interactions = Counter(
 )
 
 # Feedback metrics
-feedback_metrics = Counter(
-    'feedback_metrics',
-    'User feedback metrics',
-    ['version', 'feedback_type', 'sentiment']
+feedback_metrics = guard_labels(
+    Counter(
+        'feedback_metrics',
+        'User feedback metrics',
+        ['version', 'feedback_type', 'sentiment']
+    ),
+    allowed={'feedback_type': ('yes', 'no')},
+    max_values={'sentiment': 10}
 )
 
 # Conversion metrics for A/B testing
@@ -36,10 +42,13 @@ performance_metrics = Histogram(
 )
 
 
-review_counter = Counter(
-    'restaurant_reviews_total',
-    'Total number of restaurant reviews analyzed',
-    ['sentiment']
+review_counter = guard_labels(
+    Counter(
+        'restaurant_reviews_total',
+        'Total number of restaurant reviews analyzed',
+        ['sentiment']
+    ),
+    max_values={'sentiment': 10}
 )
 
 sentiment_analysis_duration = Histogram(
@@ -48,10 +57,46 @@ sentiment_analysis_duration = Histogram(
     buckets=[0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0]
 )
 
+# Predict input size metrics
+predict_request_size_bytes = Histogram(
+    'predict_request_size_bytes',
+    'Size of predict request bodies in bytes',
+    buckets=[64, 256, 1024, 4096, 16384, 65536]
+)
+
+review_length_chars = Histogram(
+    'review_length_chars',
+    'Length of normalised review text in characters',
+    buckets=[16, 64, 128, 256, 512, 1024, 2048]
+)
+
+predict_rejected_total = Counter(
+    'predict_rejected_total',
+    'Predict requests rejected during preprocessing',
+    ['reason']
+)
+
+# Rate limiting metrics
+rate_limited_requests_total = Counter(
+    'rate_limited_requests_total',
+    'Requests rejected by the rate limiter',
+    ['blueprint']
+)
+
+# Startup metrics
+warmup_duration_seconds = Gauge(
+    'warmup_duration_seconds',
+    'Time spent in the warm-up phase before the app reported ready'
+)
+
 # Base metrics (existing)
 current_users_gauge = Gauge('current_users', 'Number of users currently using the application', ['version'])
 total_predict_times = Counter('total_predict_times', 'Number of prediction button clicks', ['version'])
-user_feedback_counter = Counter('user_feedback', 'User feedback counter', ['version', 'feedback', 'sentiment'])
+user_feedback_counter = guard_labels(
+    Counter('user_feedback', 'User feedback counter', ['version', 'feedback', 'sentiment']),
+    allowed={'feedback': ('yes', 'no')},
+    max_values={'sentiment': 10}
+)
 
 # Add derived/aggregated metrics for easier querying
 feedback_total = Gauge('feedback_total', 'Total feedback count by version', ['version'])
@@ -82,6 +127,10 @@ def create_app(config_name=None):
     app_settings = os.getenv("APP_SETTINGS", "config.DevelopmentConfig")
     app.config.from_object(app_settings)
     app.config["VERSION"] = get_version()
+    
+    # Take the client address from X-Forwarded-For set by trusted proxies
+    if app.config.get("PROXY_FIX_X_FOR"):
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config["PROXY_FIX_X_FOR"])
     app.config['MODEL_SERVICE_URL'] = os.environ.get('MODEL_SERVICE_URL', 'http://model-service:3000')
     app.config['PORT'] = os.environ.get("PORT", 5000)
     
@@ -107,6 +156,26 @@ def create_app(config_name=None):
     app.register_blueprint(model_bp)
     app.register_blueprint(metrics_bp)
     
+    # Opt-in capture of sampled requests for replay
+    from app.capture import init_traffic_capture
+    init_traffic_capture(app)
+    
+    # Restrict sentiment labels to the known model outputs
+    if app.config.get("ALLOWED_SENTIMENTS"):
+        for metric in (feedback_metrics, review_counter, user_feedback_counter):
+            metric.allow('sentiment', app.config["ALLOWED_SENTIMENTS"])
+    
+    # Per-client rate limits for the API blueprints
+    from app.ratelimit import init_rate_limits
+    init_rate_limits(app)
+    
+    # Worker pool and job table for asynchronous predictions
+    from app.models.jobs import init_prediction_jobs
+    init_prediction_jobs(app)
+    
+    # Warm up connections, templates and specs before reporting ready
+    from app.warmup import start_warmup
+    start_warmup(app, swagger)
     
     return app
 
@@ -0,0 +1,84 @@
+import json
+import logging
+import random
+import time
+from logging.handlers import RotatingFileHandler
+from flask import request, g
+
+
+def _review_field(mode, review):
+    """Represent a review in the capture according to `TRAFFIC_CAPTURE_REVIEWS`."""
+    if mode == "verbatim":
+        return review
+    if mode == "hash":
+        from app.models.preprocessing import review_cache_key
+        return review_cache_key(review)
+    return None
+
+
+def init_traffic_capture(app):
+    """
+    Records a sample of incoming requests to a rotating JSONL file.
+
+    Capturing is off unless `TRAFFIC_CAPTURE_FILE` is set. Each sampled
+    request is written as one line with its start time, method, endpoint,
+    path, status, body size and duration. Requests that match no route
+    (404s, 405s) are not recorded. For predict requests the
+    normalised review length is stored, plus the review itself hashed or
+    verbatim depending on `TRAFFIC_CAPTURE_REVIEWS` ("hash", "verbatim" or
+    "none"). Files rotate at `TRAFFIC_CAPTURE_MAX_BYTES`.
+    """
+    path = app.config.get("TRAFFIC_CAPTURE_FILE")
+    if not path:
+        return None
+
+    sample_rate = app.config.get("TRAFFIC_CAPTURE_SAMPLE_RATE", 1.0)
+    review_mode = app.config.get("TRAFFIC_CAPTURE_REVIEWS", "hash")
+
+    capture_logger = logging.getLogger("app.traffic_capture")
+    capture_logger.setLevel(logging.INFO)
+    capture_logger.propagate = False
+    # Replace the handler of an earlier app so records go to this app's file
+    for handler in list(capture_logger.handlers):
+        capture_logger.removeHandler(handler)
+        handler.close()
+    handler = RotatingFileHandler(
+        path,
+        maxBytes=app.config.get("TRAFFIC_CAPTURE_MAX_BYTES", 10 * 1024 * 1024),
+        backupCount=app.config.get("TRAFFIC_CAPTURE_BACKUPS", 3),
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    capture_logger.addHandler(handler)
+
+    @app.before_request
+    def start_capture():
+        if request.endpoint in (None, "static"):
+            return
+        if random.random() < sample_rate:
+            g.capture_start = (time.time(), time.perf_counter())
+
+    @app.after_request
+    def record_capture(response):
+        start = g.pop("capture_start", None)
+        if start is None:
+            return response
+
+        record = {
+            "ts": round(start[0], 6),
+            "method": request.method,
+            "endpoint": request.endpoint,
+            "path": request.path,
+            "status": response.status_code,
+            "size": request.content_length or 0,
+            "duration": round(time.perf_counter() - start[1], 6),
+        }
+        review = g.get("predict_review")
+        if review is not None:
+            record["review_len"] = len(review)
+            field = _review_field(review_mode, review)
+            if field is not None:
+                record["review"] = field
+        capture_logger.info(json.dumps(record, separators=(",", ":")))
+        return response
+
+    return capture_logger
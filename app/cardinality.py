@@ -0,0 +1,125 @@
+import threading
+from prometheus_client import REGISTRY
+from prometheus_client.core import GaugeMetricFamily, CounterMetricFamily
+
+
+OVERFLOW_VALUE = "other"
+
+_guards = []
+
+
+class LabelGuard:
+    """
+    Wraps a labelled metric and bounds the values its labels can take.
+
+    Labels listed in `allowed` only accept those values. Labels listed in
+    `max_values` and without a whitelist accept the first N distinct values
+    seen, as a fallback for labels whose values are not known up front.
+    Anything else is
+    folded into the `other` bucket. Values are stringified and cut to
+    `max_length` characters. All other attributes are passed through to the
+    wrapped metric, so the guard can be used wherever the metric was.
+    """
+
+    def __init__(self, metric, allowed=None, max_values=None, max_length=64):
+        self._metric = metric
+        self._allowed = {label: frozenset(values) for label, values in (allowed or {}).items()}
+        self._max_values = dict(max_values or {})
+        self._seen = {label: set() for label in self._max_values}
+        self._max_length = max_length
+        self._lock = threading.Lock()
+        self.overflow_count = 0
+
+    def __getattr__(self, name):
+        return getattr(self._metric, name)
+
+    @property
+    def metric_name(self):
+        """Name of the exported series, including the `_total` suffix of counters."""
+        if self._metric._type == "counter":
+            return self._metric._name + "_total"
+        return self._metric._name
+
+    def allow(self, label, values):
+        """Restricts `label` to `values`, replacing any first-N cap on it."""
+        with self._lock:
+            self._allowed[label] = frozenset(values)
+            self._max_values.pop(label, None)
+            self._seen.pop(label, None)
+
+    def _guard_value(self, label, value):
+        value = str(value)[:self._max_length]
+        allowed = self._allowed.get(label)
+        if allowed is not None:
+            return value if value in allowed else None
+
+        seen = self._seen.get(label)
+        if seen is None or value in seen:
+            return value
+        with self._lock:
+            if value in seen:
+                return value
+            if len(seen) >= self._max_values[label]:
+                return None
+            seen.add(value)
+        return value
+
+    def labels(self, *labelvalues, **labelkwargs):
+        """Same as the metric's `labels()`, with out-of-bounds values replaced by `other`."""
+        if labelvalues:
+            labelkwargs = dict(zip(self._metric._labelnames, labelvalues))
+
+        guarded = {}
+        for label, value in labelkwargs.items():
+            safe = self._guard_value(label, value)
+            if safe is None:
+                with self._lock:
+                    self.overflow_count += 1
+                safe = OVERFLOW_VALUE
+            guarded[label] = safe
+        return self._metric.labels(**guarded)
+
+    def series_count(self):
+        """Number of label combinations the wrapped metric currently holds."""
+        return len(self._metric._metrics)
+
+
+def guard_labels(metric, allowed=None, max_values=None, max_length=64):
+    """
+    Wraps `metric` in a `LabelGuard` and includes it in the series report.
+
+    Returns:
+        LabelGuard: The guarded metric.
+    """
+    guard = LabelGuard(metric, allowed=allowed, max_values=max_values, max_length=max_length)
+    _guards.append(guard)
+    return guard
+
+
+def series_counts():
+    """Returns the number of series held by each guarded metric, by metric name."""
+    return {guard.metric_name: guard.series_count() for guard in _guards}
+
+
+class SeriesReportCollector:
+    """Exports series counts and label overflows of guarded metrics at scrape time."""
+
+    def collect(self):
+        series = GaugeMetricFamily(
+            'metric_series',
+            'Number of label combinations held by a guarded metric',
+            labels=['metric']
+        )
+        overflow = CounterMetricFamily(
+            'metric_label_overflow',
+            'Label values folded into the other bucket by the cardinality guard',
+            labels=['metric']
+        )
+        for guard in _guards:
+            series.add_metric([guard.metric_name], guard.series_count())
+            overflow.add_metric([guard.metric_name], guard.overflow_count)
+        yield series
+        yield overflow
+
+
+REGISTRY.register(SeriesReportCollector())
@@ -0,0 +1,173 @@
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+
+
+class JobStoreFullError(Exception):
+    """When the job table holds the maximum number of pending jobs"""
+    pass
+
+
+class JobStore:
+    """
+    Bounded in-memory table of prediction jobs.
+
+    Finished jobs expire `ttl` seconds after they finished, however long they
+    were queued. When the table is full, expired jobs are dropped first, then
+    the ones that finished earliest. Pending jobs are never evicted or
+    expired, so the table also bounds the number of jobs queued on the
+    worker pool.
+    """
+
+    def __init__(self, max_jobs=1000, ttl=300):
+        self.max_jobs = max_jobs
+        self.ttl = ttl
+        self._jobs = {}
+        # (finished, job_id) in the order jobs finished
+        self._finished = deque()
+        self._cond = threading.Condition()
+
+    def __len__(self):
+        with self._cond:
+            return len(self._jobs)
+
+    def _evict(self, now):
+        """Drop expired jobs, then the earliest finished ones until there is room. Caller holds the lock."""
+        while self._finished and (
+            now - self._finished[0][0] >= self.ttl or len(self._jobs) >= self.max_jobs
+        ):
+            _, job_id = self._finished.popleft()
+            del self._jobs[job_id]
+
+    def create(self):
+        """
+        Adds a new pending job.
+
+        Raises:
+            JobStoreFullError: If every slot is taken by a pending job.
+
+        Returns:
+            str: The new job ID.
+        """
+        now = time.time()
+        with self._cond:
+            self._evict(now)
+            if len(self._jobs) >= self.max_jobs:
+                raise JobStoreFullError("Too many pending prediction jobs")
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = {"status": "pending", "result": None, "error": None, "finished": None}
+            return job_id
+
+    def _finish(self, job_id, status, result=None, error=None):
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None or job["status"] != "pending":
+                return
+            finished = time.time()
+            job.update(status=status, result=result, error=error, finished=finished)
+            self._finished.append((finished, job_id))
+            self._cond.notify_all()
+
+    def complete(self, job_id, result):
+        """Stores the result of a finished job and wakes up waiters."""
+        self._finish(job_id, "done", result=result)
+
+    def fail(self, job_id, error):
+        """Marks a job as failed with an error message and wakes up waiters."""
+        self._finish(job_id, "error", error=error)
+
+    def _snapshot(self, job_id):
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if job["finished"] is not None and time.time() - job["finished"] >= self.ttl:
+            return None
+        snapshot = {"job_id": job_id, "status": job["status"]}
+        if job["status"] == "done":
+            snapshot["result"] = job["result"]
+        elif job["status"] == "error":
+            snapshot["error"] = job["error"]
+        return snapshot
+
+    def get(self, job_id):
+        """
+        Returns a snapshot of a job.
+
+        Returns:
+            dict: The job's ID, status and result or error, or None if the
+            job is unknown or expired.
+        """
+        with self._cond:
+            return self._snapshot(job_id)
+
+    def wait(self, job_id, timeout):
+        """
+        Blocks until a job is finished or `timeout` seconds have passed.
+
+        Returns:
+            dict: The latest job snapshot, or None if the job is unknown or expired.
+        """
+        deadline = time.time() + timeout
+        with self._cond:
+            while True:
+                snapshot = self._snapshot(job_id)
+                remaining = deadline - time.time()
+                if snapshot is None or snapshot["status"] != "pending" or remaining <= 0:
+                    return snapshot
+                self._cond.wait(remaining)
+
+
+def init_prediction_jobs(app):
+    """Attach a job store and a bounded worker pool for prediction jobs to the app."""
+    app.extensions["prediction_jobs"] = {
+        "store": JobStore(
+            max_jobs=app.config.get("PREDICTION_JOB_MAX", 1000),
+            ttl=app.config.get("PREDICTION_JOB_TTL", 300),
+        ),
+        "executor": ThreadPoolExecutor(
+            max_workers=app.config.get("PREDICTION_JOB_WORKERS", 4),
+            thread_name_prefix="prediction-job",
+        ),
+    }
+
+
+def get_job_store():
+    """Returns the job store of the current app."""
+    return current_app.extensions["prediction_jobs"]["store"]
+
+
+def _run_prediction(app, store, job_id, review):
+    from app.models.model_handler import predict_with_model
+
+    with app.app_context():
+        try:
+            result = predict_with_model({"input": review})
+            if not result:
+                raise ValueError("No results returned")
+            store.complete(job_id, result)
+        except Exception as e:
+            app.logger.error(f"Prediction job {job_id} failed: {str(e)}")
+            store.fail(job_id, str(e))
+
+
+def submit_prediction(review):
+    """
+    Queues a prediction for a normalised review on the worker pool.
+
+    Args:
+        review (str): Review text as returned by the preprocessing stage.
+
+    Raises:
+        JobStoreFullError: If too many jobs are pending.
+
+    Returns:
+        str: The ID of the new job.
+    """
+    jobs = current_app.extensions["prediction_jobs"]
+    store = jobs["store"]
+    job_id = store.create()
+    jobs["executor"].submit(_run_prediction, current_app._get_current_object(), store, job_id, review)
+    return job_id
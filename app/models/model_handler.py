@@ -10,6 +10,23 @@ class ModelNotFoundError(Exception):
     """When a requested model is not found"""
     pass
 
+_session = None
+
+def get_session():
+    """
+    Returns the HTTP session shared by all model service calls.
+
+    Reusing one session keeps connections to the model service pooled,
+    so only the first request pays for connection setup.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
 def load_model(model_name):
     """
     Loads a model configuration by its name.
@@ -79,7 +96,11 @@ def predict_with_model(data):
     else:
         model_request = {"Review": input_data}
         
-        api_response = requests.post(model_url, json=model_request)
+        api_response = get_session().post(
+            model_url,
+            json=model_request,
+            timeout=current_app.config.get('MODEL_SERVICE_TIMEOUT', 10)
+        )
         api_response.raise_for_status()  # Raise exception for HTTP errors
         response = api_response.json()
     
@@ -91,5 +112,5 @@ def predict_with_model(data):
     sentiment_analysis_duration.observe(processing_time)
     
     
-    current_app.logger.info(f"Made prediction with model: {input_data}")
+    current_app.logger.info(f"Made prediction with model: {len(input_data)} chars")
     return response
@@ -0,0 +1,138 @@
+import json
+import hashlib
+import re
+import unicodedata
+from flask import current_app, g
+from app import predict_request_size_bytes, review_length_chars, predict_rejected_total
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class InputRejectedError(Exception):
+    """When a predict request fails preprocessing"""
+    status_code = 400
+
+    def __init__(self, message, reason):
+        super().__init__(message)
+        self.reason = reason
+
+
+class PayloadTooLargeError(InputRejectedError):
+    """When a predict request body exceeds the configured size"""
+    status_code = 413
+
+
+def normalize_review(text):
+    """
+    Normalises review text into its canonical form.
+
+    Applies Unicode NFKC normalisation, drops control characters and
+    collapses runs of whitespace into single spaces.
+
+    Args:
+        text (str): The raw review text.
+
+    Returns:
+        str: The normalised review text.
+    """
+    text = unicodedata.normalize("NFKC", text)
+    text = "".join(
+        ch for ch in text
+        if ch.isspace() or unicodedata.category(ch) != "Cc"
+    )
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def review_cache_key(text):
+    """
+    Builds a stable key for a normalised review, usable for caching.
+
+    Args:
+        text (str): Review text as returned by `normalize_review`.
+
+    Returns:
+        str: Hex digest identifying the review.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def read_json_body(req, max_bytes):
+    """
+    Reads and decodes a JSON request body without exceeding `max_bytes`.
+
+    The declared Content-Length is checked before anything is read, and the
+    stream is read with a hard limit so chunked bodies are bounded as well.
+
+    Args:
+        req (flask.Request): The incoming request.
+        max_bytes (int): Largest accepted body size.
+
+    Raises:
+        PayloadTooLargeError: If the body is larger than `max_bytes`.
+        InputRejectedError: If the body is not valid JSON.
+
+    Returns:
+        The decoded JSON value, or None for an empty or non-JSON body.
+    """
+    length = req.content_length
+    if length is not None and length > max_bytes:
+        predict_request_size_bytes.observe(length)
+        raise PayloadTooLargeError(f"Request body exceeds {max_bytes} bytes", "body_too_large")
+
+    if not req.is_json:
+        return None
+
+    raw = req.stream.read(max_bytes + 1)
+    if len(raw) > max_bytes:
+        # Only a lower bound is known for oversized bodies without Content-Length
+        predict_request_size_bytes.observe(len(raw))
+        raise PayloadTooLargeError(f"Request body exceeds {max_bytes} bytes", "body_too_large")
+
+    predict_request_size_bytes.observe(len(raw))
+    if not raw:
+        return None
+
+    try:
+        return json.loads(raw)
+    except ValueError:
+        raise InputRejectedError("Request body is not valid JSON", "invalid_json")
+
+
+def preprocess_predict_request(req):
+    """
+    Validates and normalises a predict request.
+
+    Args:
+        req (flask.Request): The incoming predict request.
+
+    Raises:
+        InputRejectedError: If the body or review is missing, malformed or too large.
+
+    Returns:
+        str: The normalised review text, or None if no input data was sent.
+    """
+    max_bytes = current_app.config.get("MAX_PREDICT_BODY_BYTES", 16 * 1024)
+    max_length = current_app.config.get("MAX_REVIEW_LENGTH", 2000)
+
+    try:
+        data = read_json_body(req, max_bytes)
+        if not data:
+            return None
+
+        text = data.get("input") if isinstance(data, dict) else None
+        if not isinstance(text, str):
+            raise InputRejectedError("Field 'input' must be a string", "invalid_input")
+
+        text = normalize_review(text)
+        if not text:
+            raise InputRejectedError("No input provided for prediction", "empty_input")
+        if len(text) > max_length:
+            raise InputRejectedError(f"Review exceeds {max_length} characters", "review_too_long")
+    except InputRejectedError as e:
+        predict_rejected_total.labels(reason=e.reason).inc()
+        raise
+
+    review_length_chars.observe(len(text))
+    g.predict_review = text
+    return text
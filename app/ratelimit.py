@@ -0,0 +1,134 @@
+import math
+import threading
+import time
+from flask import request, jsonify
+from werkzeug.utils import import_string
+from app import rate_limited_requests_total
+
+
+class MemoryBackend:
+    """
+    Process-local token bucket store.
+
+    Each bucket is a two-item list `[tokens, last_seen]` keyed by
+    `(scope, client)`. Tokens are refilled lazily when a bucket is used, and
+    buckets idle for longer than `idle_ttl` seconds are swept out at most
+    once every `sweep_interval` seconds. At most `max_buckets` buckets are
+    kept; when a new client arrives at the limit, the oldest bucket is dropped.
+
+    A shared backend (e.g. one backed by Redis) can replace this class as long
+    as it accepts the same `idle_ttl` and `max_buckets` keyword arguments
+    (it may ignore them) and provides the same `consume` method.
+    """
+
+    def __init__(self, idle_ttl=300, sweep_interval=60, max_buckets=100000):
+        self.idle_ttl = idle_ttl
+        self.sweep_interval = sweep_interval
+        self.max_buckets = max_buckets
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic() + sweep_interval
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def _sweep(self, now):
+        """Drop idle buckets. Caller holds the lock."""
+        cutoff = now - self.idle_ttl
+        for key in [k for k, bucket in self._buckets.items() if bucket[1] < cutoff]:
+            del self._buckets[key]
+        self._next_sweep = now + self.sweep_interval
+
+    def consume(self, key, rate, burst, now=None):
+        """
+        Takes one token from the bucket for `key`.
+
+        Args:
+            key (tuple): Bucket key, `(scope, client)`.
+            rate (float): Tokens added per second.
+            burst (int): Bucket capacity.
+            now (float): Current monotonic time, looked up if omitted.
+
+        Returns:
+            float: 0 if the request is allowed, otherwise the seconds until
+            a token becomes available.
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_buckets:
+                    del self._buckets[next(iter(self._buckets))]
+                self._buckets[key] = [burst - 1.0, now]
+                return 0.0
+            tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if tokens >= 1.0:
+                bucket[0] = tokens - 1.0
+                return 0.0
+            bucket[0] = tokens
+            return (1.0 - tokens) / rate
+
+
+def client_key(api_keys):
+    """
+    Identify the client by its API key if it is one of `api_keys`, else by its IP address.
+
+    Unknown keys are ignored so that rotating made-up keys cannot be used to
+    get a fresh bucket on every request.
+    """
+    api_key = request.headers.get("X-API-Key")
+    if api_key and api_key in api_keys:
+        return "key:" + api_key
+    return "ip:" + (request.remote_addr or "unknown")
+
+
+def init_rate_limits(app):
+    """
+    Installs per-blueprint rate limiting on the app.
+
+    Limits come from the `RATELIMITS` config, a mapping of blueprint name to
+    `{"rate": tokens_per_second, "burst": capacity}`. Only requests whose
+    method is in `RATELIMIT_METHODS` are counted. Clients sending an
+    `X-API-Key` listed in `RATELIMIT_API_KEYS` get their own bucket, all
+    others are limited by IP address. `RATELIMIT_BACKEND` may name an
+    alternative backend class by import path; it is constructed as
+    `cls(idle_ttl=..., max_buckets=...)` and must provide `consume()` like
+    `MemoryBackend`.
+    """
+    limits = {
+        name: (float(limit["rate"]), int(limit["burst"]))
+        for name, limit in app.config.get("RATELIMITS", {}).items()
+    }
+    if not app.config.get("RATELIMIT_ENABLED", True) or not limits:
+        return None
+
+    backend_cls = import_string(app.config["RATELIMIT_BACKEND"]) if app.config.get("RATELIMIT_BACKEND") else MemoryBackend
+    backend = backend_cls(
+        idle_ttl=app.config.get("RATELIMIT_IDLE_TTL", 300),
+        max_buckets=app.config.get("RATELIMIT_MAX_BUCKETS", 100000),
+    )
+    api_keys = frozenset(app.config.get("RATELIMIT_API_KEYS", ()))
+    methods = frozenset(app.config.get("RATELIMIT_METHODS", ("POST",)))
+    app.extensions["ratelimit"] = backend
+
+    @app.before_request
+    def apply_rate_limit():
+        limit = limits.get(request.blueprint)
+        if limit is None or request.method not in methods:
+            return None
+
+        retry_after = backend.consume((request.blueprint, client_key(api_keys)), limit[0], limit[1])
+        if not retry_after:
+            return None
+
+        rate_limited_requests_total.labels(blueprint=request.blueprint).inc()
+        response = jsonify({"error": "Too many requests"})
+        response.status_code = 429
+        response.headers["Retry-After"] = str(math.ceil(retry_after))
+        return response
+
+    return backend
@@ -1,4 +1,5 @@
 from flask import Blueprint, jsonify, render_template, current_app
+from app.warmup import is_ready
 from lib_version.version_awareness import VersionUtil
 from app import current_users_gauge, get_version
 from app.routes.metrics_route import extract_major_version
@@ -50,3 +51,51 @@ def health_check():
                   example: alive!
     """
     return jsonify({"status": "alive!"})
+
+@main_bp.route('/live', methods=['GET'])
+def liveness_check():
+    """
+    Liveness probe endpoint.
+    ---
+    tags:
+      - Main
+    summary: Reports that the process is running, even while warming up.
+    responses:
+      200:
+        description: Application is alive.
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                status:
+                  type: string
+                  example: alive!
+    """
+    return jsonify({"status": "alive!"})
+
+@main_bp.route('/ready', methods=['GET'])
+def readiness_check():
+    """
+    Readiness probe endpoint.
+    ---
+    tags:
+      - Main
+    summary: Reports whether the warm-up phase has finished and traffic can be served.
+    responses:
+      200:
+        description: Application is warmed up and ready.
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                status:
+                  type: string
+                  example: ready
+      503:
+        description: Application is still warming up.
+    """
+    if not is_ready(current_app):
+        return jsonify({"status": "warming up"}), 503
+    return jsonify({"status": "ready"})
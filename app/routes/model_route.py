@@ -1,4 +1,6 @@
-from flask import Blueprint, jsonify, request, current_app
+import json
+import math
+from flask import Blueprint, jsonify, request, current_app, Response, stream_with_context
 
 model_bp = Blueprint('model', __name__, url_prefix="/api/models")
 
@@ -36,24 +38,207 @@ def predict():
                       type: string
                       example: "positive"
       400:
-        description: Bad Request - No input data provided.
+        description: Bad Request - No input data provided or the review is invalid or too long.
+      413:
+        description: Payload Too Large - Request body exceeds the configured limit.
       500:
         description: Internal Server Error - Prediction failed.
     """
-    data = request.get_json()
+    # Validation and normalisation
+    from app.models.preprocessing import preprocess_predict_request, InputRejectedError
     
-    # Validation
-    if not data:
+    try:
+        review = preprocess_predict_request(request)
+    except InputRejectedError as e:
+        return jsonify({"error": str(e)}), e.status_code
+    
+    if not review:
         return jsonify({"error": "No input data provided"}), 400
     
     # Invoke model service
     from app.models.model_handler import predict_with_model
     
     try:
-        result = predict_with_model(data)
+        result = predict_with_model({"input": review})
         if not result:
             raise ValueError(f"No results returned")
         return jsonify({"result": result})
     except Exception as e:
         current_app.logger.error(f"Prediction error: {str(e)}")
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+        return jsonify({"error": str(e)}), 500
+
+@model_bp.route('/predict/jobs', methods=['POST'])
+def submit_predict_job():
+    """
+    Submit a review for asynchronous sentiment analysis.
+    ---
+    tags:
+      - Model
+    summary: Queues a prediction and returns a job ID immediately.
+    requestBody:
+      required: true
+      content:
+        application/json:
+          schema:
+            type: object
+            properties:
+              input:
+                type: string
+                description: The review text to analyze.
+                example: "The food was amazing!"
+    responses:
+      202:
+        description: Prediction job accepted.
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                job_id:
+                  type: string
+                status:
+                  type: string
+                  example: pending
+      400:
+        description: Bad Request - No input data provided or the review is invalid or too long.
+      413:
+        description: Payload Too Large - Request body exceeds the configured limit.
+      503:
+        description: Service Unavailable - Too many pending jobs, retry after the `Retry-After` header.
+    """
+    from app.models.preprocessing import preprocess_predict_request, InputRejectedError
+    from app.models.jobs import submit_prediction, JobStoreFullError
+    
+    try:
+        review = preprocess_predict_request(request)
+    except InputRejectedError as e:
+        return jsonify({"error": str(e)}), e.status_code
+    
+    if not review:
+        return jsonify({"error": "No input data provided"}), 400
+    
+    try:
+        job_id = submit_prediction(review)
+    except JobStoreFullError as e:
+        response = jsonify({"error": str(e)})
+        response.status_code = 503
+        response.headers["Retry-After"] = "1"
+        return response
+    
+    response = jsonify({"job_id": job_id, "status": "pending"})
+    response.status_code = 202
+    response.headers["Location"] = f"{model_bp.url_prefix}/predict/jobs/{job_id}"
+    return response
+
+@model_bp.route('/predict/jobs/<job_id>', methods=['GET'])
+def get_predict_job(job_id):
+    """
+    Get the state of a prediction job, optionally long-polling for the result.
+    ---
+    tags:
+      - Model
+    summary: Returns the job status and, once done, its result.
+    parameters:
+      - in: path
+        name: job_id
+        schema:
+          type: string
+        required: true
+      - in: query
+        name: wait
+        schema:
+          type: number
+        required: false
+        description: Seconds to wait for the job to finish before answering.
+    responses:
+      200:
+        description: Job state.
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                job_id:
+                  type: string
+                status:
+                  type: string
+                  enum: [pending, done, error]
+                result:
+                  type: object
+                  properties:
+                    prediction:
+                      type: string
+                      example: "positive"
+                error:
+                  type: string
+      400:
+        description: Bad Request - `wait` is not a finite number.
+      404:
+        description: Not Found - Unknown or expired job.
+    """
+    from app.models.jobs import get_job_store
+    
+    max_wait = current_app.config.get("PREDICTION_JOB_MAX_WAIT", 5)
+    wait = request.args.get("wait", 0, type=float)
+    if not math.isfinite(wait):
+        return jsonify({"error": "Parameter 'wait' must be a finite number"}), 400
+    wait = min(max(wait, 0), max_wait)
+    
+    store = get_job_store()
+    job = store.wait(job_id, wait) if wait else store.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job)
+
+@model_bp.route('/predict/jobs/<job_id>/events', methods=['GET'])
+def stream_predict_job(job_id):
+    """
+    Stream the result of a prediction job as Server-Sent Events.
+    ---
+    tags:
+      - Model
+    summary: Sends a `result` event with the job state once it has finished.
+    parameters:
+      - in: path
+        name: job_id
+        schema:
+          type: string
+        required: true
+    responses:
+      200:
+        description: Event stream with keep-alive comments and a final `result` event.
+        content:
+          text/event-stream:
+            schema:
+              type: string
+      404:
+        description: Not Found - Unknown or expired job.
+    """
+    from app.models.jobs import get_job_store
+    
+    store = get_job_store()
+    if store.get(job_id) is None:
+        return jsonify({"error": "Job not found"}), 404
+    
+    max_wait = current_app.config.get("PREDICTION_JOB_MAX_WAIT", 5)
+    keepalive = current_app.config.get("PREDICTION_JOB_KEEPALIVE", 10)
+    
+    def events():
+        waited = 0
+        while True:
+            job = store.wait(job_id, min(keepalive, max_wait - waited))
+            waited += keepalive
+            if job is None:
+                yield f"event: result\ndata: {json.dumps({'job_id': job_id, 'status': 'error', 'error': 'Job not found'})}\n\n"
+                return
+            if job["status"] != "pending" or waited >= max_wait:
+                # A pending job here tells the client to reconnect
+                yield f"event: result\ndata: {json.dumps(job)}\n\n"
+                return
+            yield ": keep-alive\n\n"
+    
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
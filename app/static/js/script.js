@@ -8,6 +8,102 @@ window.addEventListener('beforeunload', function() {
     navigator.sendBeacon('/api/metrics/user_leave');
 });
 
+// Synchronous prediction, used when the job API is unavailable
+async function predictSync(reviewText) {
+    const response = await fetch('/api/models/predict', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            input: reviewText
+        })
+    });
+    return response.json();
+}
+
+// Convert a finished job into the same shape as the synchronous response
+function jobToResponse(job) {
+    if (job.status === 'done') {
+        return { result: job.result };
+    }
+    return { error: job.error || 'Prediction did not finish' };
+}
+
+// Long-poll the job endpoint until the job is no longer pending
+async function pollJob(jobUrl) {
+    while (true) {
+        const response = await fetch(`${jobUrl}?wait=5`);
+        const job = await response.json();
+        if (!response.ok || job.status !== 'pending') {
+            return jobToResponse(job);
+        }
+    }
+}
+
+// Wait for the job result over Server-Sent Events, reconnecting while the job is
+// pending and falling back to long-polling if the stream fails
+function waitForJob(jobUrl) {
+    if (!window.EventSource) {
+        return pollJob(jobUrl);
+    }
+    return new Promise((resolve) => {
+        const source = new EventSource(`${jobUrl}/events`);
+        source.addEventListener('result', (event) => {
+            source.close();
+            const job = JSON.parse(event.data);
+            resolve(job.status === 'pending' ? waitForJob(jobUrl) : jobToResponse(job));
+        });
+        source.onerror = () => {
+            source.close();
+            resolve(pollJob(jobUrl));
+        };
+    });
+}
+
+// Submit the review as an asynchronous job, falling back to the synchronous endpoint
+async function requestPrediction(reviewText) {
+    let response;
+    try {
+        response = await fetch('/api/models/predict/jobs', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                input: reviewText
+            })
+        });
+    } catch (error) {
+        return predictSync(reviewText);
+    }
+
+    if (response.status === 202) {
+        const job = await response.json();
+        return waitForJob(`/api/models/predict/jobs/${job.job_id}`);
+    }
+    if (response.status === 429 || response.status === 503) {
+        // Throttled or job table full: back off instead of retrying elsewhere
+        const retryAfter = parseInt(response.headers.get('Retry-After'), 10) || 1;
+        pauseAnalyzeButton(retryAfter);
+        const reason = response.status === 429 ? 'Too many requests' : 'Server is busy';
+        return { error: `${reason}, please try again in ${retryAfter}s` };
+    }
+    if (response.status === 404) {
+        return predictSync(reviewText);
+    }
+    return response.json();
+}
+
+// Disable the analyze button for the given number of seconds
+function pauseAnalyzeButton(seconds) {
+    const button = document.getElementById('analyze-btn');
+    button.disabled = true;
+    setTimeout(() => {
+        button.disabled = false;
+    }, seconds * 1000);
+}
+
 document.getElementById('analyze-btn').addEventListener('click', async function() {
     const reviewText = document.getElementById('review').value.trim();
     
@@ -25,17 +121,7 @@ document.getElementById('analyze-btn').addEventListener('click', async function(
         fetch('/api/metrics/click', {method: 'POST'});
 
         // Send review text to the model API for sentiment analysis
-        const response = await fetch('/api/models/predict', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({
-                input: reviewText
-            })
-        });
-        
-        const data = await response.json();
+        const data = await requestPrediction(reviewText);
         
         // Hide loader
         document.getElementById('loader').style.display = 'none';
@@ -52,7 +138,7 @@ document.getElementById('analyze-btn').addEventListener('click', async function(
         if (data.result) {
             sentimentResult.textContent = `Sentiment: ${data.result.prediction}`;
         } else {
-            sentimentResult.textContent = 'Error: Could not analyze sentiment';
+            sentimentResult.textContent = data.error ? `Error: ${data.error}` : 'Error: Could not analyze sentiment';
             resultDiv.classList.add('neutral');
         }
         
@@ -0,0 +1,126 @@
+import json
+import threading
+import time
+from flask import render_template
+from app import warmup_duration_seconds
+
+
+def is_ready(app):
+    """Whether the warm-up phase has finished for this app."""
+    return app.extensions.get("warmup", {}).get("ready", False)
+
+
+def load_sample_reviews(path, limit):
+    """
+    Reads up to `limit` sample reviews from a JSONL file.
+
+    Each line is a JSON object; the review is taken from its `input`,
+    `review` or `body` field, whichever is present first.
+
+    Args:
+        path (str): Path to the JSONL file.
+        limit (int): Maximum number of reviews to return.
+
+    Returns:
+        list: The sample review strings.
+    """
+    reviews = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if len(reviews) >= limit:
+                break
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            for field in ("input", "review", "body"):
+                if isinstance(entry.get(field), str) and entry[field].strip():
+                    reviews.append(entry[field])
+                    break
+    return reviews
+
+
+def _warm_model_service(app, samples):
+    """Open pooled connections to the model service and replay sample reviews."""
+    from app.models.model_handler import get_session
+    from app.models.preprocessing import normalize_review
+
+    base_url = app.config.get("MODEL_SERVICE_URL")
+    if base_url is None or base_url == "test":
+        return
+
+    timeout = app.config.get("WARMUP_TIMEOUT", 2.0)
+    session = get_session()
+    try:
+        session.get(base_url, timeout=timeout)
+    except Exception as e:
+        app.logger.warning(f"Warm-up could not reach model service: {e}")
+        return
+
+    for review in samples:
+        try:
+            session.post(base_url + "/predict", json={"Review": normalize_review(review)}, timeout=timeout)
+        except Exception as e:
+            app.logger.warning(f"Warm-up sample prediction failed: {e}")
+            break
+
+
+def warm_up(app, swagger):
+    """
+    Runs the warm-up phase and marks the app as ready.
+
+    Builds the Swagger spec, renders `index.html` once, opens connections to
+    the model service and optionally replays sample reviews from
+    `WARMUP_SAMPLES_FILE`. Failures are logged and do not block readiness.
+
+    Args:
+        app (flask.Flask): The application to warm up.
+        swagger (flasgger.Swagger): The app's Swagger extension.
+    """
+    start_time = time.time()
+    state = app.extensions["warmup"]
+
+    with app.app_context():
+        try:
+            with app.test_request_context("/"):
+                swagger.get_apispecs()
+                render_template("index.html", version=app.config["VERSION"], lib_version="")
+        except Exception as e:
+            app.logger.warning(f"Warm-up rendering failed: {e}")
+
+        samples = []
+        samples_file = app.config.get("WARMUP_SAMPLES_FILE")
+        if samples_file:
+            try:
+                samples = load_sample_reviews(samples_file, app.config.get("WARMUP_SAMPLE_LIMIT", 5))
+            except OSError as e:
+                app.logger.warning(f"Could not read warm-up samples: {e}")
+
+        _warm_model_service(app, samples)
+
+    duration = time.time() - start_time
+    warmup_duration_seconds.set(duration)
+    state["duration"] = duration
+    state["ready"] = True
+    app.logger.info(f"Warm-up finished in {duration:.3f}s")
+
+
+def start_warmup(app, swagger):
+    """
+    Starts the warm-up phase for a freshly created app.
+
+    Warm-up runs in a background thread so `/live` answers immediately while
+    `/ready` reports 503 until it has finished. With `WARMUP_ENABLED` off the
+    app is marked ready straight away.
+    """
+    app.extensions["warmup"] = {"ready": False, "duration": None}
+
+    if not app.config.get("WARMUP_ENABLED", True):
+        app.extensions["warmup"]["ready"] = True
+        return None
+
+    thread = threading.Thread(target=warm_up, args=(app, swagger), name="app-warmup", daemon=True)
+    thread.start()
+    return thread
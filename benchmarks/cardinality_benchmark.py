@@ -0,0 +1,96 @@
+"""
+Scrape time and RSS under adversarial label input, with and without the
+cardinality guard. Also checks that a real value sent after the flood still
+gets its own series; the run exits with 1 if the guard folded it.
+
+Each mode runs in its own subprocess so RSS numbers are not shared:
+
+    python benchmarks/cardinality_benchmark.py --values 50000
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def rss_mb():
+    """Current resident set size in MB."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # Fall back to peak RSS where /proc is unavailable
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+def run_mode(guarded, values, scrapes):
+    """Feed `values` unique label values into a counter and time `scrapes` scrapes."""
+    from prometheus_client import CollectorRegistry, Counter, generate_latest
+    from app.cardinality import LabelGuard
+
+    registry = CollectorRegistry()
+    counter = Counter(
+        'feedback_metrics',
+        'User feedback metrics',
+        ['version', 'feedback_type', 'sentiment'],
+        registry=registry
+    )
+    if guarded:
+        counter = LabelGuard(counter, allowed={'feedback_type': ('yes', 'no'), 'sentiment': ('positive', 'negative')})
+
+    rss_before = rss_mb()
+    start_time = time.perf_counter()
+    for _ in range(values):
+        # Unique, long values as a misbehaving client would send them
+        counter.labels(version="1", feedback_type=uuid.uuid4().hex, sentiment=uuid.uuid4().hex * 4).inc()
+    insert_time = time.perf_counter() - start_time
+    rss_after = rss_mb()
+
+    start_time = time.perf_counter()
+    for _ in range(scrapes):
+        size = len(generate_latest(registry))
+    scrape_time = (time.perf_counter() - start_time) / scrapes
+
+    # Real values sent after the flood must still get their own series
+    counter.labels(version="1", feedback_type="yes", sentiment="positive").inc()
+    real_kept = ("1", "yes", "positive") in counter._metrics
+
+    series = len(counter._metrics)
+    print(f"{'guarded' if guarded else 'unguarded':<10} series={series:<8} "
+          f"insert={insert_time * 1000:9.1f}ms scrape={scrape_time * 1000:9.2f}ms "
+          f"body={size / 1024:9.1f}KiB rss_delta={rss_after - rss_before:7.1f}MB "
+          f"real_values_kept={'yes' if real_kept else 'NO'}")
+    return real_kept
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--values", type=int, default=20000, help="number of adversarial label values")
+    parser.add_argument("--scrapes", type=int, default=5, help="number of timed scrapes")
+    parser.add_argument("--mode", choices=["guarded", "unguarded"], help="run a single mode in-process")
+    args = parser.parse_args()
+
+    if args.mode:
+        return 0 if run_mode(args.mode == "guarded", args.values, args.scrapes) else 1
+
+    failed = False
+    for mode in ("unguarded", "guarded"):
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--mode", mode,
+             "--values", str(args.values), "--scrapes", str(args.scrapes)]
+        )
+        failed = failed or (mode == "guarded" and result.returncode != 0)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""
+Replays a traffic capture against the app with a stubbed model service.
+
+Requests from a capture written by `TRAFFIC_CAPTURE_FILE` are sent through
+the Flask test client at recorded speed, scaled speed or back to back.
+Overall throughput (completed requests per second of wall-clock replay time)
+and per-endpoint mean and p99 latency are reported and compared against a
+stored baseline. The run fails if throughput drops, if the latency of a
+predict or metrics endpoint regresses, or if such an endpoint is missing
+from the replay. Latency is measured per endpoint, so a slow route does not
+show up as a regression on the others.
+
+    python benchmarks/replay_traffic.py capture.jsonl --write-baseline baseline.json
+    python benchmarks/replay_traffic.py capture.jsonl --baseline baseline.json
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Endpoints whose recorded body carries a review
+PREDICT_ENDPOINTS = ("model.predict", "model.submit_predict_job")
+
+# Job lookups refer to job IDs from the original run and cannot be replayed
+SKIPPED_ENDPOINTS = ("model.get_predict_job", "model.stream_predict_job", "static")
+
+# Synthetic bodies for metrics routes that read JSON
+METRICS_BODIES = {
+    "metrics.record_feedback": {"feedback": "yes", "sentiment": "positive"},
+}
+
+# Endpoints checked against the baseline
+GATED_PREFIXES = ("model.predict", "metrics.")
+
+
+def start_model_stub(latency):
+    """Starts a local model service that answers every prediction after `latency` seconds."""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        def _reply(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            if latency:
+                time.sleep(latency)
+            body = json.dumps({"prediction": "positive"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = _reply
+        do_POST = _reply
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def load_capture(path):
+    """Reads a capture file and its rotated backups, oldest first, sorted by start time."""
+    suffixes = [p[len(path) + 1:] for p in glob.glob(glob.escape(path) + ".*")]
+    backups = [f"{path}.{n}" for n in sorted((int(s) for s in suffixes if s.isdigit()), reverse=True)]
+    records = []
+    for file_path in backups + [path]:
+        if not os.path.exists(file_path):
+            continue
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    # Requests that matched no route have no endpoint and cannot be attributed
+    records = [r for r in records if r.get("endpoint") and r["endpoint"] not in SKIPPED_ENDPOINTS]
+    records.sort(key=lambda r: r["ts"])
+    return records
+
+
+def filler_text(length):
+    """Review-like text of exactly `length` characters."""
+    return ("good food " * (length // 10 + 1))[:length]
+
+
+def build_body(record):
+    """
+    Rebuilds the JSON body of a captured request.
+
+    Predict requests get their review back if it was kept verbatim, or text
+    of the recorded review length if it was hashed. Requests rejected before
+    the review was read (e.g. with 413) have no review length; they get a body
+    of the recorded byte size so the same rejection path is exercised.
+
+    Returns:
+        str: The JSON body, or None for requests without one.
+    """
+    endpoint = record.get("endpoint")
+    if endpoint in PREDICT_ENDPOINTS:
+        review = record.get("review")
+        length = record.get("review_len")
+        if length is None:
+            padding = max(record.get("size", 0) - len(json.dumps({"input": ""})), 0)
+            return json.dumps({"input": "x" * padding})
+        if review is None or len(review) != length:
+            # Hashed or omitted reviews are replaced by text of the same length
+            review = filler_text(length)
+        return json.dumps({"input": review})
+    body = METRICS_BODIES.get(endpoint)
+    return json.dumps(body) if body is not None else None
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of `values`."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def replay(records, speed, workers, model_latency):
+    """
+    Sends captured requests to a fresh app instance.
+
+    Args:
+        records (list): Capture records sorted by start time.
+        speed (float): Replay speed relative to the recording; 0 sends requests back to back.
+        workers (int): Number of concurrent clients.
+        model_latency (float): Seconds the stubbed model service takes per prediction.
+
+    Returns:
+        dict: `throughput`, the completed requests per second of wall-clock
+        replay time, and `endpoints`, a mapping of endpoint to its `count`,
+        `errors`, `mean` and `p99` latency in seconds.
+    """
+    stub = start_model_stub(model_latency)
+    os.environ.update({
+        "MODEL_SERVICE_URL": f"http://127.0.0.1:{stub.server_address[1]}",
+        "APP_SETTINGS": "config.ProductionConfig",
+        "WARMUP_ENABLED": "0",
+        "RATELIMIT_ENABLED": "0",
+    })
+    os.environ.pop("TRAFFIC_CAPTURE_FILE", None)
+
+    from app import create_app
+    app = create_app()
+    app.logger.disabled = True
+
+    local = threading.local()
+    latencies = {}
+    errors = {}
+    lock = threading.Lock()
+
+    def send(record):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = app.test_client()
+        body = build_body(record)
+        start_time = time.perf_counter()
+        try:
+            if body is None:
+                response = client.open(record["path"], method=record["method"])
+            else:
+                response = client.open(record["path"], method=record["method"], data=body, content_type="application/json")
+            response.get_data()
+            failed = response.status_code >= 500
+        except Exception:
+            failed = True
+        duration = time.perf_counter() - start_time
+        with lock:
+            latencies.setdefault(record["endpoint"], []).append(duration)
+            if failed:
+                errors[record["endpoint"]] = errors.get(record["endpoint"], 0) + 1
+
+    first_ts = records[0]["ts"] if records else 0
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for record in records:
+            if speed > 0:
+                delay = (record["ts"] - first_ts) / speed - (time.perf_counter() - start_time)
+                if delay > 0:
+                    time.sleep(delay)
+            pool.submit(send, record)
+    elapsed = time.perf_counter() - start_time
+    stub.shutdown()
+
+    return {
+        "throughput": len(records) / elapsed if elapsed else 0.0,
+        "endpoints": {
+            endpoint: {
+                "count": len(values),
+                "errors": errors.get(endpoint, 0),
+                "mean": sum(values) / len(values),
+                "p99": percentile(values, 99),
+            }
+            for endpoint, values in latencies.items()
+        },
+    }
+
+
+def find_regressions(results, baseline, tolerance, min_slack):
+    """
+    Lists regressions of a replay against the baseline.
+
+    Overall throughput may drop by `tolerance`. For gated endpoints, mean and
+    p99 latency may grow by `tolerance` or by `min_slack` seconds, whichever
+    is larger, so sub-millisecond jitter on fast routes does not fail the
+    run. Gated endpoints that are in the baseline but were not replayed, or
+    that returned server errors, count as regressions.
+    """
+    regressions = []
+    if results["throughput"] < baseline["throughput"] * (1 - tolerance):
+        regressions.append(f"throughput {results['throughput']:.1f}/s < baseline {baseline['throughput']:.1f}/s")
+
+    for endpoint, base in baseline["endpoints"].items():
+        if not endpoint.startswith(GATED_PREFIXES):
+            continue
+        current = results["endpoints"].get(endpoint)
+        if current is None:
+            regressions.append(f"{endpoint}: in baseline but not replayed")
+            continue
+        for stat in ("mean", "p99"):
+            if current[stat] > max(base[stat] * (1 + tolerance), base[stat] + min_slack):
+                regressions.append(f"{endpoint}: {stat} {current[stat] * 1000:.2f}ms > baseline {base[stat] * 1000:.2f}ms")
+        if current["errors"]:
+            regressions.append(f"{endpoint}: {current['errors']} server errors")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("capture", help="capture file written via TRAFFIC_CAPTURE_FILE")
+    parser.add_argument("--speed", type=float, default=0, help="replay speed relative to the recording, 0 for back to back")
+    parser.add_argument("--workers", type=int, default=4, help="number of concurrent clients")
+    parser.add_argument("--model-latency", type=float, default=0.0, help="seconds the stubbed model service takes per prediction")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--write-baseline", help="write the results as a new baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression, e.g. 0.2 for 20%%")
+    parser.add_argument("--min-slack", type=float, default=0.01, help="allowed absolute increase of mean and p99 latency in seconds")
+    args = parser.parse_args()
+
+    records = load_capture(args.capture)
+    if not records:
+        print(f"No replayable requests in {args.capture}")
+        return 1
+
+    results = replay(records, args.speed, args.workers, args.model_latency)
+    for endpoint, result in sorted(results["endpoints"].items()):
+        print(f"{endpoint:<32} count={result['count']:<6} errors={result['errors']:<4} "
+              f"mean={result['mean'] * 1000:8.2f}ms p99={result['p99'] * 1000:8.2f}ms")
+    print(f"{'overall':<32} count={len(records):<6} throughput={results['throughput']:.1f}/s")
+
+    if args.write_baseline:
+        with open(args.write_baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.write_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.tolerance, args.min_slack)
+        if regressions:
+            print("Performance regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
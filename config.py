@@ -6,6 +6,61 @@ class Config:
     TESTING = False
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     
+    # Predict input limits, checked before the body is parsed
+    MAX_PREDICT_BODY_BYTES = int(os.getenv("MAX_PREDICT_BODY_BYTES", 16 * 1024))
+    MAX_REVIEW_LENGTH = int(os.getenv("MAX_REVIEW_LENGTH", 2000))
+    
+    # Warm-up phase run before /ready reports ready
+    WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "1") == "1"
+    WARMUP_SAMPLES_FILE = os.getenv("WARMUP_SAMPLES_FILE")
+    WARMUP_SAMPLE_LIMIT = int(os.getenv("WARMUP_SAMPLE_LIMIT", 5))
+    WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", 2.0))
+    
+    # Asynchronous prediction jobs
+    PREDICTION_JOB_WORKERS = int(os.getenv("PREDICTION_JOB_WORKERS", 4))
+    PREDICTION_JOB_MAX = int(os.getenv("PREDICTION_JOB_MAX", 1000))
+    PREDICTION_JOB_TTL = int(os.getenv("PREDICTION_JOB_TTL", 300))
+    PREDICTION_JOB_MAX_WAIT = int(os.getenv("PREDICTION_JOB_MAX_WAIT", 5))
+    PREDICTION_JOB_KEEPALIVE = int(os.getenv("PREDICTION_JOB_KEEPALIVE", 10))
+    
+    # Seconds to wait for the model service before a prediction fails
+    MODEL_SERVICE_TIMEOUT = float(os.getenv("MODEL_SERVICE_TIMEOUT", 10))
+    
+    # Sentiment label values accepted by metrics, others are counted as "other"
+    ALLOWED_SENTIMENTS = frozenset(
+        v.strip().lower() for v in os.getenv("ALLOWED_SENTIMENTS", "positive,negative,neutral").split(",") if v.strip()
+    )
+    
+    # Number of trusted proxies in front of the app setting X-Forwarded-For
+    PROXY_FIX_X_FOR = int(os.getenv("PROXY_FIX_X_FOR", 0))
+    
+    # Per-client token bucket limits, keyed by blueprint name. Off by default
+    # until PROXY_FIX_X_FOR is set, since behind a proxy without it every
+    # client shares the proxy's address and therefore one bucket.
+    RATELIMIT_ENABLED = os.getenv("RATELIMIT_ENABLED", "1" if PROXY_FIX_X_FOR else "0") == "1"
+    RATELIMITS = {
+        "model": {
+            "rate": float(os.getenv("RATELIMIT_MODEL_RATE", 2)),
+            "burst": int(os.getenv("RATELIMIT_MODEL_BURST", 10)),
+        },
+        "metrics": {
+            "rate": float(os.getenv("RATELIMIT_METRICS_RATE", 10)),
+            "burst": int(os.getenv("RATELIMIT_METRICS_BURST", 30)),
+        },
+    }
+    RATELIMIT_METHODS = ("POST",)
+    RATELIMIT_BACKEND = os.getenv("RATELIMIT_BACKEND")
+    RATELIMIT_IDLE_TTL = int(os.getenv("RATELIMIT_IDLE_TTL", 300))
+    RATELIMIT_MAX_BUCKETS = int(os.getenv("RATELIMIT_MAX_BUCKETS", 100000))
+    RATELIMIT_API_KEYS = frozenset(k for k in os.getenv("RATELIMIT_API_KEYS", "").split(",") if k)
+    
+    # Opt-in traffic capture for local replay
+    TRAFFIC_CAPTURE_FILE = os.getenv("TRAFFIC_CAPTURE_FILE")
+    TRAFFIC_CAPTURE_SAMPLE_RATE = float(os.getenv("TRAFFIC_CAPTURE_SAMPLE_RATE", 1.0))
+    TRAFFIC_CAPTURE_REVIEWS = os.getenv("TRAFFIC_CAPTURE_REVIEWS", "hash")
+    TRAFFIC_CAPTURE_MAX_BYTES = int(os.getenv("TRAFFIC_CAPTURE_MAX_BYTES", 10 * 1024 * 1024))
+    TRAFFIC_CAPTURE_BACKUPS = int(os.getenv("TRAFFIC_CAPTURE_BACKUPS", 3))
+    
 class DevelopmentConfig(Config):
     """Development Configuration"""
     DEBUG = True
@@ -15,6 +70,7 @@ class TestingConfig(Config):
     """Testing Configuration"""
     TESTING = True
     DEBUG = True
+    RATELIMIT_ENABLED = False
 
 class ProductionConfig(Config):
     """Production Configuration"""
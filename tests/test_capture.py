@@ -0,0 +1,66 @@
+import json
+import pytest
+from flask import Blueprint, Flask, jsonify, request
+from app.capture import init_traffic_capture
+from app.models.preprocessing import preprocess_predict_request, review_cache_key
+from app.ratelimit import init_rate_limits
+
+
+def make_app(tmp_path, reviews="hash"):
+    app = Flask(__name__)
+    app.config.update(
+        TRAFFIC_CAPTURE_FILE=str(tmp_path / "capture.jsonl"),
+        TRAFFIC_CAPTURE_REVIEWS=reviews,
+        RATELIMIT_ENABLED=True,
+        RATELIMITS={"model": {"rate": 0.001, "burst": 1}},
+    )
+    model_bp = Blueprint("model", __name__)
+
+    @model_bp.route("/predict", methods=["POST"])
+    def predict():
+        return jsonify({"review": preprocess_predict_request(request)})
+
+    app.register_blueprint(model_bp)
+    init_traffic_capture(app)
+    init_rate_limits(app)
+    return app
+
+
+def read_capture(tmp_path):
+    with open(tmp_path / "capture.jsonl") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("mode, expected", [
+    ("hash", review_cache_key("Nice food")),
+    ("verbatim", "Nice food"),
+    ("none", None),
+])
+def test_review_is_recorded_by_mode(tmp_path, mode, expected):
+    client = make_app(tmp_path, reviews=mode).test_client()
+    client.post("/predict", json={"input": "  Nice\nfood "})
+
+    [record] = read_capture(tmp_path)
+    assert record["endpoint"] == "model.predict"
+    assert record["status"] == 200
+    assert record["review_len"] == len("Nice food")
+    assert record.get("review") == expected
+
+
+def test_throttled_requests_are_recorded(tmp_path):
+    client = make_app(tmp_path).test_client()
+    assert client.post("/predict", json={"input": "good"}).status_code == 200
+    assert client.post("/predict", json={"input": "good"}).status_code == 429
+
+    records = read_capture(tmp_path)
+    assert [r["status"] for r in records] == [200, 429]
+    assert "review_len" not in records[1]
+    assert records[1]["size"] > 0
+
+
+def test_unrouted_requests_are_not_recorded(tmp_path):
+    client = make_app(tmp_path).test_client()
+    assert client.get("/missing").status_code == 404
+    assert client.get("/predict").status_code == 405
+
+    assert read_capture(tmp_path) == []
@@ -0,0 +1,52 @@
+from prometheus_client import CollectorRegistry, Counter, Gauge
+from app.cardinality import LabelGuard, OVERFLOW_VALUE
+
+
+def make_counter():
+    return Counter('feedback', 'Feedback', ['feedback', 'sentiment'], registry=CollectorRegistry())
+
+
+def test_values_outside_whitelist_fold_into_other():
+    guard = LabelGuard(make_counter(), allowed={'feedback': ('yes', 'no'), 'sentiment': ('positive',)})
+
+    guard.labels(feedback='yes', sentiment='positive').inc()
+    guard.labels(feedback='maybe', sentiment='junk').inc()
+
+    assert set(guard._metrics) == {('yes', 'positive'), (OVERFLOW_VALUE, OVERFLOW_VALUE)}
+    assert guard.overflow_count == 2
+
+
+def test_first_n_cap_keeps_values_already_seen():
+    guard = LabelGuard(make_counter(), max_values={'sentiment': 2})
+
+    for sentiment in ('a', 'b', 'c', 'a'):
+        guard.labels(feedback='yes', sentiment=sentiment).inc()
+
+    assert set(guard._metrics) == {('yes', 'a'), ('yes', 'b'), ('yes', OVERFLOW_VALUE)}
+    assert guard.series_count() == 3
+
+
+def test_allow_replaces_first_n_cap():
+    guard = LabelGuard(make_counter(), max_values={'sentiment': 1})
+    guard.labels(feedback='yes', sentiment='junk').inc()
+
+    guard.allow('sentiment', ('positive', 'negative'))
+    guard.labels(feedback='yes', sentiment='positive').inc()
+    guard.labels(feedback='yes', sentiment='junk').inc()
+
+    assert ('yes', 'positive') in guard._metrics
+    assert guard._metrics[('yes', OVERFLOW_VALUE)]._value.get() == 1
+
+
+def test_positional_labels_and_truncation():
+    guard = LabelGuard(make_counter(), max_length=4)
+
+    guard.labels('yes', 'positive').inc()
+
+    assert ('yes', 'posi') in guard._metrics
+
+
+def test_metric_name_matches_exported_series():
+    assert LabelGuard(make_counter()).metric_name == 'feedback_total'
+    gauge = Gauge('conversion', 'Conversion', ['version'], registry=CollectorRegistry())
+    assert LabelGuard(gauge).metric_name == 'conversion'
@@ -0,0 +1,100 @@
+import threading
+import pytest
+from flask import Flask
+from app.models import jobs
+from app.models.jobs import JobStore, JobStoreFullError, init_prediction_jobs, get_job_store
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.time() in the jobs module."""
+    now = [1000.0]
+    monkeypatch.setattr(jobs.time, "time", lambda: now[0])
+    return now
+
+
+def test_create_raises_when_all_jobs_pending(clock):
+    store = JobStore(max_jobs=2, ttl=60)
+    store.create()
+    store.create()
+    with pytest.raises(JobStoreFullError):
+        store.create()
+
+
+def test_full_table_evicts_oldest_finished_job_first(clock):
+    store = JobStore(max_jobs=3, ttl=60)
+    pending = store.create()
+    older = store.create()
+    newer = store.create()
+    store.complete(older, {"prediction": "positive"})
+    store.complete(newer, {"prediction": "negative"})
+
+    store.create()
+
+    assert store.get(older) is None
+    assert store.get(newer)["result"] == {"prediction": "negative"}
+    assert store.get(pending)["status"] == "pending"
+
+
+def test_finished_job_expires_ttl_after_finishing(clock):
+    store = JobStore(max_jobs=10, ttl=60)
+    job_id = store.create()
+    # Queued for longer than the TTL before it ran
+    clock[0] += 120
+    store.fail(job_id, "boom")
+    assert store.get(job_id) == {"job_id": job_id, "status": "error", "error": "boom"}
+
+    clock[0] += 59
+    assert store.get(job_id) is not None
+    clock[0] += 1
+    assert store.get(job_id) is None
+    store.create()
+    assert len(store) == 1
+
+
+def test_pending_job_survives_ttl(clock):
+    store = JobStore(max_jobs=2, ttl=60)
+    job_id = store.create()
+    clock[0] += 120
+
+    store.create()
+    with pytest.raises(JobStoreFullError):
+        store.create()
+    assert store.get(job_id)["status"] == "pending"
+
+
+def test_wait_returns_when_job_completes():
+    store = JobStore(max_jobs=10, ttl=60)
+    job_id = store.create()
+    threading.Timer(0.05, store.complete, args=(job_id, {"prediction": "positive"})).start()
+
+    job = store.wait(job_id, 5)
+
+    assert job["status"] == "done"
+    assert job["result"] == {"prediction": "positive"}
+
+
+def test_wait_times_out_on_pending_job():
+    store = JobStore(max_jobs=10, ttl=60)
+    job_id = store.create()
+    assert store.wait(job_id, 0.01)["status"] == "pending"
+    assert store.wait("unknown", 0.01) is None
+
+
+def test_long_poll_rejects_non_finite_wait():
+    # Importing the routes package pulls in main_route, which needs lib_version
+    pytest.importorskip("lib_version")
+    from app.routes.model_route import model_bp
+
+    app = Flask(__name__)
+    app.config.update(PREDICTION_JOB_WORKERS=1)
+    app.register_blueprint(model_bp)
+    init_prediction_jobs(app)
+    with app.app_context():
+        job_id = get_job_store().create()
+
+    client = app.test_client()
+    for wait in ("nan", "inf"):
+        response = client.get(f"/api/models/predict/jobs/{job_id}?wait={wait}")
+        assert response.status_code == 400
+    assert client.get(f"/api/models/predict/jobs/{job_id}?wait=0.01").get_json()["status"] == "pending"
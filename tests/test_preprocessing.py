@@ -0,0 +1,68 @@
+import io
+import pytest
+from flask import Flask, request
+from app import predict_request_size_bytes
+from app.models.preprocessing import (
+    normalize_review,
+    preprocess_predict_request,
+    InputRejectedError,
+    PayloadTooLargeError,
+)
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config.update(MAX_PREDICT_BODY_BYTES=64, MAX_REVIEW_LENGTH=10)
+    return app
+
+
+class UnreadableStream(io.BytesIO):
+    """Request body that fails the test if it is read."""
+
+    def read(self, *args):
+        raise AssertionError("body was read")
+
+
+def size_sum():
+    return predict_request_size_bytes._sum.get()
+
+
+def test_normalize_review():
+    assert normalize_review("  Ｆood\t\tis\n  great\x07 ") == "Food is great"
+    assert normalize_review("ﬁne dining") == "fine dining"
+
+
+def test_preprocess_returns_normalised_review(app):
+    with app.test_request_context(method="POST", json={"input": "  Nice\n\nfood "}):
+        assert preprocess_predict_request(request) == "Nice food"
+
+
+def test_oversized_content_length_is_rejected_before_reading(app):
+    before = size_sum()
+    environ = {"wsgi.input": UnreadableStream(), "CONTENT_LENGTH": "1000"}
+    with app.test_request_context(method="POST", content_type="application/json", environ_overrides=environ):
+        with pytest.raises(PayloadTooLargeError) as e:
+            preprocess_predict_request(request)
+    assert e.value.status_code == 413
+    assert size_sum() - before == 1000
+
+
+@pytest.mark.parametrize("body, reason", [
+    ('{"input": ', "invalid_json"),
+    ('{"input": 5}', "invalid_input"),
+    ('["input"]', "invalid_input"),
+    ('{"input": "   "}', "empty_input"),
+    ('{"input": "far too long review"}', "review_too_long"),
+])
+def test_invalid_input_is_rejected(app, body, reason):
+    with app.test_request_context(method="POST", data=body, content_type="application/json"):
+        with pytest.raises(InputRejectedError) as e:
+            preprocess_predict_request(request)
+    assert e.value.reason == reason
+    assert e.value.status_code == 400
+
+
+def test_missing_body_returns_none(app):
+    with app.test_request_context(method="POST"):
+        assert preprocess_predict_request(request) is None
@@ -0,0 +1,60 @@
+import pytest
+from flask import Flask
+from app.ratelimit import MemoryBackend, client_key
+
+
+KEY = ("model", "ip:10.0.0.1")
+
+
+def test_burst_then_retry_after():
+    backend = MemoryBackend()
+    assert [backend.consume(KEY, rate=2, burst=3, now=0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert backend.consume(KEY, rate=2, burst=3, now=0.0) == pytest.approx(0.5)
+
+
+def test_lazy_refill():
+    backend = MemoryBackend()
+    backend.consume(KEY, rate=2, burst=1, now=0.0)
+
+    assert backend.consume(KEY, rate=2, burst=1, now=0.25) == pytest.approx(0.25)
+    assert backend.consume(KEY, rate=2, burst=1, now=0.5) == 0.0
+
+
+def test_refill_is_capped_at_burst():
+    backend = MemoryBackend()
+    backend.consume(KEY, rate=1, burst=2, now=0.0)
+
+    results = [backend.consume(KEY, rate=1, burst=2, now=100.0) for _ in range(3)]
+
+    assert results[:2] == [0.0, 0.0]
+    assert results[2] > 0
+
+
+def test_idle_buckets_are_swept(monkeypatch):
+    monkeypatch.setattr("app.ratelimit.time.monotonic", lambda: 0.0)
+    backend = MemoryBackend(idle_ttl=10, sweep_interval=5)
+    backend.consume(("model", "idle"), rate=1, burst=5, now=0.0)
+    backend.consume(("model", "active"), rate=1, burst=5, now=8.0)
+
+    backend.consume(("model", "new"), rate=1, burst=5, now=14.0)
+
+    assert len(backend) == 2
+    assert ("model", "idle") not in backend._buckets
+
+
+def test_bucket_count_is_capped():
+    backend = MemoryBackend(max_buckets=2)
+    for client in ("a", "b", "c"):
+        backend.consume(("model", client), rate=1, burst=5, now=0.0)
+
+    assert len(backend) == 2
+    assert ("model", "a") not in backend._buckets
+
+
+def test_client_key_ignores_unknown_api_keys():
+    app = Flask(__name__)
+    headers = {"X-API-Key": "made-up"}
+    with app.test_request_context(headers=headers, environ_base={"REMOTE_ADDR": "10.0.0.1"}):
+        assert client_key(frozenset({"valid"})) == "ip:10.0.0.1"
+    with app.test_request_context(headers={"X-API-Key": "valid"}):
+        assert client_key(frozenset({"valid"})) == "key:valid"
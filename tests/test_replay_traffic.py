@@ -0,0 +1,75 @@
+import json
+from benchmarks.replay_traffic import build_body, find_regressions, load_capture
+
+
+def result(throughput=100.0, **endpoints):
+    return {
+        "throughput": throughput,
+        "endpoints": {
+            name.replace("__", "."): {"count": 10, "errors": 0, "mean": 0.01, "p99": 0.02, **stats}
+            for name, stats in endpoints.items()
+        },
+    }
+
+
+def write_lines(path, records):
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+
+def test_load_capture_reads_backups_oldest_first(tmp_path):
+    capture = tmp_path / "capture.jsonl"
+    write_lines(tmp_path / "capture.jsonl.2", [{"ts": 1, "endpoint": "model.predict"}])
+    write_lines(tmp_path / "capture.jsonl.1", [{"ts": 2, "endpoint": "metrics.record_feedback"}])
+    write_lines(capture, [
+        {"ts": 3, "endpoint": "model.predict"},
+        {"ts": 4, "endpoint": None, "path": "/missing"},
+        {"ts": 5, "endpoint": "model.get_predict_job"},
+    ])
+    (tmp_path / "capture.jsonl.1").open("a").write("not json\n")
+
+    records = load_capture(str(capture))
+
+    assert [r["ts"] for r in records] == [1, 2, 3]
+
+
+def test_build_body_keeps_verbatim_and_pads_hashed_reviews():
+    assert json.loads(build_body({"endpoint": "model.predict", "review": "tasty", "review_len": 5})) == {"input": "tasty"}
+    body = json.loads(build_body({"endpoint": "model.predict", "review": "ab12cd", "review_len": 40}))
+    assert len(body["input"]) == 40
+
+
+def test_build_body_rebuilds_recorded_size_without_review():
+    body = build_body({"endpoint": "model.predict", "size": 20000})
+    assert len(body) == 20000
+    assert build_body({"endpoint": "main.index"}) is None
+
+
+def test_no_regressions_within_tolerance():
+    baseline = result(model__predict={"mean": 0.1, "p99": 0.2})
+    current = result(throughput=90.0, model__predict={"mean": 0.11, "p99": 0.22})
+    assert find_regressions(current, baseline, tolerance=0.2, min_slack=0.0) == []
+
+
+def test_throughput_drop_is_a_regression():
+    regressions = find_regressions(result(throughput=50.0), result(), tolerance=0.2, min_slack=0.01)
+    assert len(regressions) == 1 and regressions[0].startswith("throughput")
+
+
+def test_min_slack_absorbs_jitter_on_fast_routes():
+    baseline = result(metrics__record_feedback={"mean": 0.001, "p99": 0.002})
+    current = result(metrics__record_feedback={"mean": 0.003, "p99": 0.006})
+    assert find_regressions(current, baseline, tolerance=0.2, min_slack=0.01) == []
+    assert len(find_regressions(current, baseline, tolerance=0.2, min_slack=0.001)) == 2
+
+
+def test_missing_gated_endpoint_is_a_regression():
+    baseline = result(model__predict={}, main__index={})
+    regressions = find_regressions(result(), baseline, tolerance=0.2, min_slack=0.01)
+    assert regressions == ["model.predict: in baseline but not replayed"]
+
+
+def test_server_errors_are_regressions():
+    baseline = result(model__predict={})
+    current = result(model__predict={"errors": 3}, main__index={"errors": 2})
+    regressions = find_regressions(current, baseline, tolerance=0.2, min_slack=0.01)
+    assert regressions == ["model.predict: 3 server errors"]
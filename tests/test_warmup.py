@@ -0,0 +1,73 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from flask import Flask
+from flasgger import Swagger
+
+pytest.importorskip("lib_version")
+
+from app.routes.main_route import main_bp
+from app.warmup import start_warmup
+
+
+@pytest.fixture
+def blocking_model_service():
+    """Model service stub that does not answer until the returned event is set."""
+    release = threading.Event()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            release.wait(10)
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", release
+    release.set()
+    server.shutdown()
+
+
+def make_app(**config):
+    # Named after the package so index.html is found during warm-up
+    app = Flask("app")
+    app.config.update(VERSION="test", WARMUP_TIMEOUT=10, **config)
+    app.register_blueprint(main_bp)
+    return app, Swagger(app)
+
+
+def wait_until_ready(client, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if client.get("/ready").status_code == 200:
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_ready_after_warmup_and_live_during_it(blocking_model_service):
+    url, release = blocking_model_service
+    app, swagger = make_app(MODEL_SERVICE_URL=url)
+    client = app.test_client()
+
+    start_warmup(app, swagger)
+
+    assert client.get("/ready").status_code == 503
+    assert client.get("/live").status_code == 200
+
+    release.set()
+    assert wait_until_ready(client)
+    assert client.get("/ready").get_json() == {"status": "ready"}
+    assert app.extensions["warmup"]["duration"] is not None
+
+
+def test_ready_immediately_when_warmup_disabled():
+    app, swagger = make_app(MODEL_SERVICE_URL="test", WARMUP_ENABLED=False)
+
+    assert start_warmup(app, swagger) is None
+    assert app.test_client().get("/ready").status_code == 200